@@ -6,62 +6,63 @@ Orcinus orca is a simple graphical user interface (GUI) for the ORCA quantum
 chemistry package.
 """
 
+from collections import defaultdict
 from collections.abc import MutableMapping
+from functools import partial
+from operator import is_not
 
 
 class ORCAInput(MutableMapping):
     """A simple abstraction of an ORCA input file."""
 
+    # keys rendered as a single line, in order, with their line prefixes.
+    _inliners = {"!": "! ", "maxcore": "%maxcore ", "*": "\n* "}
+    # keys never rendered as %key ... end sections.
+    _unsectioned = frozenset(["#", *_inliners])
+
     def __init__(self, data=None):
         """Construct object."""
-        self._mapping = {}
+        self._mapping = defaultdict(list)
         if data is not None:
             self.update(data)
 
     def __repr__(self):
         """Return string representation of self."""
-        return f"{type(self).__name__}({self._mapping})"
+        return f"{type(self).__name__}({dict(self._mapping)})"
 
     def generate(self):
         """Generate input content."""
-        inliners = ["!", "maxcore", "*"]
+        inliners = self._inliners
         lines = []
 
-        for item in self["#"]:
-            lines.append(f"# {item}")
+        lines.extend(f"# {item}" for item in self["#"])
 
-        for key in inliners:
-            tag = key
-            if key == "*":
-                tag = f"\n{key}"
-            elif key == "maxcore":
-                tag = f"%{key}"
-            lines.append(
-                f"{tag} {' '.join([str(v) for v in self[key] if v is not None])}"
-            )
+        for key, tag in inliners.items():
+            # filter(None, ...) would also drop falsy items such as charge 0.
+            items = map(str, filter(partial(is_not, None), self[key]))
+            lines.append(tag + " ".join(items))
 
-        for key, value in self.items():
+        unsectioned = self._unsectioned
+        for key, value in self._mapping.items():
             if (
-                not isinstance(value, list)
-                or set(value) == {None}
-                or key in inliners
-                or key == "#"
+                key in unsectioned
+                or not isinstance(value, list)
+                or all(item is None for item in value)
             ):
                 continue
-            lines.append(f"\n%{key}")
-            for item in value:
-                if item is not None:
-                    lines.append(f" {item}")
-            lines.append("end")
+            body = "\n".join(f" {item}" for item in value if item is not None)
+            lines.append(f"\n%{key}\n{body}\nend")
 
         return "\n".join(lines)
 
     def __getitem__(self, key):
-        """Get item at key."""
-        if key not in self._mapping:
-            self._mapping[key] = []
+        """Get item at key, starting an empty list if missing."""
         return self._mapping[key]
 
+    def __contains__(self, key):
+        """Return whether key holds any item."""
+        return bool(self._mapping.get(key))
+
     def __setitem__(self, key, value):
         """Set item at key to value."""
         self._mapping[key] = value
@@ -2,8 +2,9 @@
 
 """Widget that simplifies defining questionnaires."""
 
+import json
 import os
-import pickle
+from collections.abc import Mapping
 from tkinter import BooleanVar
 from tkinter import DoubleVar
 from tkinter import IntVar
@@ -16,16 +17,94 @@ from tkinter.ttk import Label
 from tkinter.ttk import LabelFrame
 from tkinter.ttk import Notebook
 
-import numpy as np
-
 from orcinus.gui.tooltip import create_tooltip
 
 # TODO(schneiderfelipe): this will change in the future.
 DATA_DIR = os.path.expanduser("~")
 
+# Tk variable classes holding values of each supported field type.
+VARIABLE_TYPES = {
+    int: IntVar,
+    bool: BooleanVar,
+    str: StringVar,
+    float: DoubleVar,
+}
+
+
+def normalize_fields(fields):
+    """Fill in missing keys of field descriptions, in place.
+
+    Inferring types and defaults only needs to happen once for a given set of
+    fields, so callers with constant fields may call this at import time.
+    Already normalized fields are left unchanged. Return fields.
+    """
+    for desc in fields.values():
+        desc.setdefault("tab", "main")
+
+        if "type" not in desc:
+            # if no type is given, first guess it based on a default value,
+            # or infer from the first valid value.
+            if "default" in desc and desc["default"] is not None:
+                desc["type"] = type(desc["default"])
+            elif "values" in desc:
+                desc["type"] = type(
+                    next(v for v in desc["values"] if v is not None)
+                )
+            else:
+                raise ValueError(
+                    f"could not infer type, please specify: {desc}"
+                )
+
+        if "default" not in desc:
+            # if no default is given, use the first value (even if None),
+            # or infer from type.
+            if "values" in desc:
+                desc["default"] = next(iter(desc["values"]))
+            else:
+                desc["default"] = desc["type"]()
+
+        # TODO(schneiderfelipe): should this be default?
+        desc.setdefault("widget", Combobox)
+        desc.setdefault("visible", True)
+    return fields
+
+
+class _ReadRecorder(Mapping):
+    """Read-only mapping that remembers which keys were read.
+
+    Every read goes through __getitem__ or __iter__, so get, in, keys and
+    items are all recorded as well.
+    """
+
+    def __init__(self, data):
+        """Construct object."""
+        self._data = data
+        self.read = set()
+
+    def __getitem__(self, key):
+        """Get item at key, recording the access."""
+        value = self._data[key]
+        self.read.add(key)
+        return value
+
+    def __iter__(self):
+        """Iterate keys, recording all of them as read."""
+        self.read.update(self._data)
+        return iter(self._data)
+
+    def __len__(self):
+        """Return number of keys."""
+        return len(self._data)
+
 
 class Questionnaire(Frame):
-    """Interface for simple questionnaires."""
+    """Interface for simple questionnaires.
+
+    A field may have a "switch", a callable that receives a read-only
+    mapping of raw option values and returns whether the field is shown.
+    Switches must be pure functions of the options they read, as their
+    results are cached by the values of those options.
+    """
 
     def __init__(
         self,
@@ -42,112 +121,236 @@ class Questionnaire(Frame):
         self.pady = pady
         self.column_minsize = column_minsize
         self.state_filename = state_filename
+        self._state_path = None
+        # earlier versions pickled the state under the same stem.
+        self._legacy_state_path = None
+        if state_filename:
+            self._state_path = os.path.join(DATA_DIR, state_filename)
+            legacy_path = os.path.splitext(self._state_path)[0] + ".pickle"
+            if legacy_path != self._state_path:
+                self._legacy_state_path = legacy_path
+        # state as last read from or written to disk.
+        self._stored_state = None
         self.master = master
         self.fields = fields
         self.create_widgets()
 
     def get_values(self):
-        """Return a dictionary of all variable values."""
-        self.update_widgets()
+        """Return a dictionary of all variable values.
+
+        Values are cached until any variable is written to.
+        """
+        if self._values is not None:
+            return dict(self._values)
+
+        # switches see the same raw values, so variables are read only once.
+        options = self._read_options()
+        self._apply_switches(options)
 
         values = {}
-        for name in self.variable:
-            if not self.fields[name]["visible"]:
+        for name, translator, fallback, none_check, visible in zip(
+            self._names,
+            self._translators,
+            self._fallbacks,
+            self._none_checks,
+            self._visible,
+        ):
+            if not visible:
                 values[name] = None
                 continue
 
-            try:
-                values[name] = self.variable[name].get()
-            except TclError:
-                values[name] = self.fields[name]["default"]
+            value = options[name]
+            if translator is not None:
+                value = translator.get(value, fallback)
 
-            if values[name] == "None":
-                values[name] = None
+            if none_check and value == "None":
+                value = None
+            values[name] = value
 
-            if "values" in self.fields[name]:
-                translator = self.fields[name]["values"]
-                if isinstance(translator, dict):
-                    try:
-                        values[name] = translator[values[name]]
-                    except KeyError:
-                        values[name] = translator[self.fields[name]["default"]]
+        self._values = values
+        return dict(values)
 
-            if values[name] == "None":
-                values[name] = None
-        return values
+    def invalidate_values(self, *args, **kwargs):
+        """Discard cached variable values."""
+        self._values = None
+
+    def _on_write(self, tcl_name, *args):
+        """Record the new raw value of a variable that was written to."""
+        i = self._tcl_names[tcl_name]
+        try:
+            self._options[self._names[i]] = self._variables[i].get()
+        except TclError:
+            self._options[self._names[i]] = self._defaults[i]
+        self._values = None
 
     def init_widgets(self, *args, ignore_state=False, **kwargs):
         """Clear all fields to default values."""
         if self.fields is None:
             return
 
-        init_values = {
-            name: desc["default"] for name, desc in self.fields.items()
-        }
-        state_path = os.path.join(DATA_DIR, self.state_filename)
-        if (
-            not ignore_state
-            and self.state_filename
-            and os.path.isfile(state_path)
-        ):
-            with open(state_path, "rb") as f:
-                state = pickle.load(f)
-            init_values.update(state)
+        state = {}
+        if not ignore_state and self._state_path:
+            state = self._read_state()
 
-        for name, value in init_values.items():
-            try:
-                self.variable[name].set(value)
-            except KeyError:
-                pass
+        for name, variable, default in zip(
+            self._names, self._variables, self._defaults
+        ):
+            variable.set(state.get(name, default))
 
         self.update_widgets()
 
     def store_widgets(self, *args, **kwargs):
-        """Store all fields to disk."""
+        """Store fields that differ from their defaults to disk.
+
+        Missing fields are restored to their defaults by init_widgets.
+        """
         if self.fields is None:
             return
 
-        if self.state_filename:
-            state_path = os.path.join(DATA_DIR, self.state_filename)
-            state = {}
-            for name, _ in self.fields.items():
+        if self._state_path:
+            options = self._read_options()
+            state = {
+                name: options[name]
+                for name, default in zip(self._names, self._defaults)
+                if options[name] != default
+            }
+            if state == self._stored_state:
+                return
+
+            # write aside and rename, so a crash never leaves a broken file.
+            temp_path = self._state_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(temp_path, self._state_path)
+            self._stored_state = state
+
+            # the state now lives in the current file.
+            if self._legacy_state_path:
                 try:
-                    state[name] = self.variable[name].get()
-                except TclError:
-                    state[name] = self.fields[name]["default"]
+                    os.remove(self._legacy_state_path)
+                except FileNotFoundError:
+                    pass
+
+    def _read_state(self):
+        """Return the state stored on disk, by name.
+
+        A missing or unreadable file just means starting from defaults. If
+        there is no current file, a state pickled by earlier versions is read
+        instead, to be migrated by the next store_widgets.
+        """
+        try:
+            with open(self._state_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            if self._legacy_state_path:
+                return self._read_legacy_state()
+            return {}
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(state, dict):
+            return {}
+        self._stored_state = state
+        return state
+
+    def _read_legacy_state(self):
+        """Return the state pickled by earlier versions, by name."""
+        # only needed once per user, so not imported at startup.
+        import pickle
+
+        try:
+            with open(self._legacy_state_path, "rb") as f:
+                state = pickle.load(f)
+        except Exception:
+            # migrating is best effort, and a broken pickle may raise almost
+            # anything.
+            return {}
 
-            with open(state_path, "wb") as f:
-                pickle.dump(state, f)
+        if not isinstance(state, dict):
+            return {}
+        return state
+
+    def is_visible(self, name):
+        """Return whether a widget is currently shown."""
+        return self._visible[self._index[name]]
 
     def enable(self, name):
         """Show a widget by name."""
-        if self.fields[name]["visible"]:
+        if self.is_visible(name):
             return
         self.toggle(name)
 
     def disable(self, name):
         """Hide a widget by name."""
-        if not self.fields[name]["visible"]:
+        if not self.is_visible(name):
             return
         self.toggle(name)
 
     def toggle(self, name):
         """Hide or show a widget by name."""
-        if not self.fields[name]["visible"]:
-            self.widget[name].grid()
-            if name in self.label:
-                self.label[name].grid()
-        else:
-            self.widget[name].grid_remove()
-            if name in self.label:
-                self.label[name].grid_remove()
-        self.fields[name]["visible"] = not self.fields[name]["visible"]
+        # make the next update_widgets reapply switches over this change.
+        self._switch_key = None
+        visible = list(self._visible)
+        i = self._index[name]
+        visible[i] = not visible[i]
+        self.set_visibility(visible)
+
+    def set_visibility(self, visible):
+        """Show or hide all widgets at once.
+
+        The argument holds one flag per field, in definition order. Only
+        widgets whose visibility actually changes are touched.
+        """
+        changed = False
+        shown = []
+        hidden = []
+        for i, (new, old) in enumerate(zip(visible, self._visible)):
+            if new == old:
+                continue
+
+            name = self._names[i]
+            if name in self._unbuilt:
+                self._build_widget(name)
+            else:
+                windows = shown if new else hidden
+                windows.append(str(self.widget[name]))
+                if name in self.label:
+                    windows.append(str(self.label[name]))
+            self._visible[i] = new
+            changed = True
+
+        # a single Tcl round-trip each for showing and hiding.
+        if shown:
+            self.tk.eval("; ".join(f"grid {window}" for window in shown))
+        if hidden:
+            self.tk.call("grid", "remove", *hidden)
+        if changed:
+            self.invalidate_values()
 
     def create_widgets(self):
         """Populate object and its widgets."""
         self.variable = {}
+        self._values = None
+        # raw variable values, updated on every write.
+        self._options = {}
+        self._tcl_names = {}
+        # per-field data in definition order, used by the hot paths.
+        self._index = {}
+        self._names = []
+        self._variables = []
+        self._defaults = []
+        self._translators = []
+        self._fallbacks = []
+        self._none_checks = []
+        self._visible = []
+        self._switches = []
+        self._switch_keys = ()
+        self._switch_key = None
+        self._switch_table = {}
         self.label = {}
         self.widget = {}
+        # widgets are only built when first shown, see _build_widget.
+        self._unbuilt = {}
         self.tab = {}
         self.group = {}
         self.notebook = Notebook(self)
@@ -156,16 +359,17 @@ class Questionnaire(Frame):
         if self.fields is None:
             return
 
-        for i, (name, desc) in enumerate(self.fields.items()):
-            if "tab" not in desc:
-                desc["tab"] = "main"
-
+        normalize_fields(self.fields)
+        # next free grid row of each tab and group, so rows stay dense.
+        rows = {}
+        for name, desc in self.fields.items():
             if desc["tab"] not in self.tab:
                 parent = Frame(self.notebook)
                 parent.columnconfigure(
                     [0, 1], weight=1, minsize=self.column_minsize
                 )
                 self.notebook.add(parent, text=desc["tab"].capitalize())
+                rows[parent] = 0
                 self.tab[desc["tab"]] = parent
             else:
                 parent = self.tab[desc["tab"]]
@@ -176,117 +380,135 @@ class Questionnaire(Frame):
                     group.columnconfigure(
                         [0, 1], weight=1, minsize=self.column_minsize
                     )
+                    rows[group] = 0
                     group.grid(
-                        row=i,
+                        row=rows[parent],
                         column=0,
                         columnspan=2,
                         sticky="ew",
                         padx=self.padx,
                         pady=9 * self.pady,
                     )
+                    rows[parent] += 1
                     self.group[desc["group"]] = group
                 else:
                     group = self.group[desc["group"]]
                 parent = group
 
-            if "values" in desc:
-                values = list(desc["values"])
-
-            if "type" not in desc:
-                # if no type is given, first guess it based on a default value,
-                # or infer from the first valid value.
-                if "default" in desc and desc["default"] is not None:
-                    desc["type"] = type(desc["default"])
-                elif "values" in desc:
-                    desc["type"] = type(
-                        [v for v in values if v is not None][0]
-                    )
-                else:
-                    raise ValueError(
-                        f"could not infer type, please specify: {desc}"
-                    )
-
-            if "default" not in desc:
-                # if no default is given, use the first value (even if None),
-                # or infer from type.
-                if "values" in desc:
-                    desc["default"] = [v for v in values][0]
-                elif "type" in desc:
-                    desc["default"] = desc["type"]()
-                else:
-                    raise ValueError(
-                        f"could not infer default, please specify: {desc}"
-                    )
-
-            if desc["type"] is int or desc["type"] is np.int64:
-                self.variable[name] = IntVar(self)
-            elif desc["type"] is bool:
-                self.variable[name] = BooleanVar(self)
-            elif desc["type"] is str:
-                self.variable[name] = StringVar(self)
-            elif desc["type"] is float:
-                self.variable[name] = DoubleVar(self)
-                if "values" in desc:
-                    values = [np.round(v, 2) for v in values]
+            try:
+                self.variable[name] = VARIABLE_TYPES[desc["type"]](self)
+            except KeyError:
+                raise ValueError(
+                    f"unknown type '{desc['type']}' for '{name}'"
+                ) from None
+            self._tcl_names[str(self.variable[name])] = len(self._names)
+            self.variable[name].trace_add("write", self._on_write)
+            self._unbuilt[name] = (rows[parent], parent)
+            rows[parent] += 1
+
+            self._index[name] = len(self._names)
+            self._names.append(name)
+            self._variables.append(self.variable[name])
+            self._defaults.append(desc["default"])
+            translator = None
+            if isinstance(desc.get("values"), dict):
+                translator = desc["values"]
+                if None in translator:
+                    # Tk variables hold None as the string "None".
+                    translator = {**translator, "None": translator[None]}
+            self._translators.append(translator)
+            # unknown entries translate like the default, looked up once.
+            if translator is None:
+                self._fallbacks.append(None)
             else:
-                raise ValueError(f"unknown type '{desc['type']}' for '{name}'")
-
-            if "text" in desc:
-                text = desc["text"]
+                self._fallbacks.append(translator[desc["default"]])
+            # only strings can come out as "None" and need normalizing.
+            if translator is None:
+                self._none_checks.append(desc["type"] is str)
             else:
-                text = name.capitalize()
+                self._none_checks.append("None" in translator.values())
+            if "switch" in desc:
+                self._switches.append((self._index[name], desc["switch"]))
+                # built once its switch first turns it on.
+                self._visible.append(False)
+            elif desc["visible"]:
+                self._build_widget(name)
+                self._visible.append(True)
+            else:
+                self._visible.append(False)
 
-            if "widget" not in desc:
-                # TODO(schneiderfelipe): should this be default?
-                desc["widget"] = Combobox
+        self.init_widgets()
 
-            if desc["widget"] is Checkbutton:
-                self.widget[name] = desc["widget"](
-                    parent, variable=self.variable[name], text=text
-                )
-            elif "values" in desc:
-                self.widget[name] = desc["widget"](
-                    parent, textvariable=self.variable[name], values=values
-                )
-            else:
-                self.widget[name] = desc["widget"](
-                    parent, textvariable=self.variable[name]
-                )
-            self.widget[name].grid(
-                row=i, column=1, sticky="ew", padx=self.padx, pady=self.pady
-            )
+    def _build_widget(self, name):
+        """Create and show the widget of a field, and its label."""
+        row, parent = self._unbuilt.pop(name)
+        desc = self.fields[name]
 
-            if "help" in desc:
-                create_tooltip(self.widget[name], desc["help"])
-
-            if desc["widget"] is not Checkbutton:
-                self.label[name] = Label(parent, text=text + ":")
-                self.label[name].grid(
-                    row=i,
-                    column=0,
-                    sticky="ew",
-                    padx=self.padx,
-                    pady=self.pady,
-                )
+        if "values" in desc:
+            values = list(desc["values"])
+            if desc["type"] is float:
+                values = [round(v, 2) for v in values]
 
-            if "visible" not in desc:
-                desc["visible"] = True
+        if "text" in desc:
+            text = desc["text"]
+        else:
+            text = name.capitalize()
 
-        self.init_widgets()
+        if desc["widget"] is Checkbutton:
+            options = {"variable": self.variable[name], "text": text}
+        else:
+            options = {"textvariable": self.variable[name]}
+            if "values" in desc:
+                options["values"] = values
+        # a Spinbox given values sets its variable to the first one, which
+        # would clobber a value set before this widget was built.
+        value = self._options.get(name)
+        self.widget[name] = desc["widget"](parent, **options)
+        if value is not None and self._options[name] != value:
+            self.variable[name].set(value)
+        self.widget[name].grid(
+            row=row, column=1, sticky="ew", padx=self.padx, pady=self.pady
+        )
+
+        if "help" in desc:
+            create_tooltip(self.widget[name], desc["help"])
+
+        if desc["widget"] is not Checkbutton:
+            self.label[name] = Label(parent, text=text + ":")
+            self.label[name].grid(
+                row=row,
+                column=0,
+                sticky="ew",
+                padx=self.padx,
+                pady=self.pady,
+            )
 
     def update_widgets(self, *args, **kwargs):
         """Update widget states."""
         if self.fields is None:
             return
 
-        options = {}
-        for name in self.variable:
-            try:
-                options[name] = self.variable[name].get()
-            except TclError:
-                options[name] = self.fields[name]["default"]
+        self._apply_switches(self._read_options())
 
-        for name, desc in self.fields.items():
+    def _read_options(self):
+        """Return the raw values of all variables, by name.
+
+        These are kept up to date by variable traces, so no variable is
+        actually read here.
+        """
+        return dict(self._options)
+
+    def _apply_switches(self, options):
+        """Show or hide switched widgets according to options."""
+        # switches are pure functions of the options they read, so their
+        # results are tabulated by the values of every option read so far.
+        key = tuple(options[name] for name in self._switch_keys)
+        if key == self._switch_key:
+            return
+
+        switched = self._switch_table.get(key)
+        if switched is None:
+            recorder = _ReadRecorder(options)
             # TODO(schneiderfelipe): allow an analogous key "freeze", which
             # does exactly the same as switch, but enables/disables the widget
             # instead of showing/hiding it. self.enable and sefl.disable should
@@ -294,8 +516,19 @@ class Questionnaire(Frame):
             # make things easier. Both "switch" (meaning available/unavailable)
             # and "freeze" (meaning impossible to change) can be used at the
             # same time. "freeze" might require setting which value is locked.
-            if "switch" in desc:
-                if desc["switch"](options):
-                    self.enable(name)
-                else:
-                    self.disable(name)
+            switched = [
+                (i, bool(switch(recorder))) for i, switch in self._switches
+            ]
+            new_keys = recorder.read.difference(self._switch_keys)
+            if new_keys:
+                # entries keyed on fewer options could never match again.
+                self._switch_keys += tuple(new_keys)
+                self._switch_table.clear()
+                key = tuple(options[name] for name in self._switch_keys)
+            self._switch_table[key] = switched
+        self._switch_key = key
+
+        visible = list(self._visible)
+        for i, flag in switched:
+            visible[i] = flag
+        self.set_visibility(visible)
@@ -27,36 +27,53 @@ class Tooltip(Frame):
         x, y, cx, cy = self.widget.bbox("insert")
         x = x + self.widget.winfo_rootx() + 27
         y = y + cy + self.widget.winfo_rooty() + 27
-        self.tipwindow = tw = Toplevel(self.widget)
-        tw.wm_overrideredirect(1)
+        self.tipwindow = tw = _tip_window(self.widget._root())
+        tw.label.configure(text=self.text)
         tw.wm_geometry("+%d+%d" % (x, y))
-        try:
-            # For Mac OS
-            tw.tk.call(
-                "::tk::unsupported::MacWindowStyle",
-                "style",
-                tw._w,
-                "help",
-                "noActivates",
-            )
-        except TclError:
-            pass
-        label = Label(
-            tw,
-            text=self.text,
-            justify="left",
-            background="#ffffe0",
-            relief="solid",
-            borderwidth=1,
-        )
-        label.pack(ipadx=1)
+        tw.deiconify()
 
     def hide_tip(self):
         """Hide tooltip."""
         tw = self.tipwindow
         self.tipwindow = None
         if tw:
-            tw.destroy()
+            tw.withdraw()
+
+
+def _tip_window(root):
+    """Return the tooltip window shared by all tooltips under root.
+
+    It is created, hidden, on first use and then only shown and hidden.
+    """
+    try:
+        return root._tip_window
+    except AttributeError:
+        pass
+
+    tw = Toplevel(root)
+    tw.withdraw()
+    tw.wm_overrideredirect(1)
+    try:
+        # For Mac OS
+        tw.tk.call(
+            "::tk::unsupported::MacWindowStyle",
+            "style",
+            tw._w,
+            "help",
+            "noActivates",
+        )
+    except TclError:
+        pass
+    tw.label = Label(
+        tw,
+        justify="left",
+        background="#ffffe0",
+        relief="solid",
+        borderwidth=1,
+    )
+    tw.label.pack(ipadx=1)
+    root._tip_window = tw
+    return tw
 
 
 def create_tooltip(widget, text):
@@ -0,0 +1,92 @@
+"""Tests for the questionnaire state file."""
+
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+from orcinus.gui import questionnaire
+from orcinus.gui.questionnaire import Questionnaire
+
+
+class StateFileTest(unittest.TestCase):
+    """Reading and storing the state without a display."""
+
+    def setUp(self):
+        """Point DATA_DIR to a temporary directory."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.data_dir = temp_dir.name
+        patcher = mock.patch.object(questionnaire, "DATA_DIR", self.data_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make(self, state_filename, nprocs):
+        """Return a questionnaire with a single field, without widgets."""
+        with mock.patch.object(
+            questionnaire.Frame, "__init__", return_value=None
+        ), mock.patch.object(Questionnaire, "create_widgets"):
+            q = Questionnaire(state_filename=state_filename)
+        q.fields = {"nprocs": {"default": 1}}
+        q._names = ["nprocs"]
+        q._defaults = [1]
+        q._options = {"nprocs": nprocs}
+        return q
+
+    def path(self, filename):
+        """Return the path of a file in DATA_DIR."""
+        return os.path.join(self.data_dir, filename)
+
+    def test_store_and_read(self):
+        """Stored state is read back."""
+        self.make("state.json", 8).store_widgets()
+        self.assertEqual(
+            self.make("state.json", 1)._read_state(), {"nprocs": 8}
+        )
+
+    def test_pickle_state_filename(self):
+        """A state filename ending in .pickle is not removed as legacy."""
+        self.make("state.pickle", 8).store_widgets()
+        self.assertTrue(os.path.isfile(self.path("state.pickle")))
+        with open(self.path("state.pickle"), encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"nprocs": 8})
+        self.assertEqual(
+            self.make("state.pickle", 1)._read_state(), {"nprocs": 8}
+        )
+
+    def test_migrate_legacy_state(self):
+        """Pickled state is read once, then replaced by the current file."""
+        with open(self.path("state.pickle"), "wb") as f:
+            pickle.dump({"nprocs": 8}, f)
+        q = self.make("state.json", 8)
+        self.assertEqual(q._read_state(), {"nprocs": 8})
+        q.store_widgets()
+        self.assertFalse(os.path.exists(self.path("state.pickle")))
+        self.assertEqual(
+            self.make("state.json", 1)._read_state(), {"nprocs": 8}
+        )
+
+    def test_unreadable_state(self):
+        """Unreadable state files mean starting from defaults."""
+        for content in ("[]", "null", "{"):
+            with open(self.path("state.json"), "w", encoding="utf-8") as f:
+                f.write(content)
+            self.assertEqual(self.make("state.json", 1)._read_state(), {})
+
+    def test_unreadable_legacy_state(self):
+        """Broken or foreign pickles mean starting from defaults."""
+        for content in (b"garbage", pickle.dumps({"nprocs": 8})[:-3]):
+            with open(self.path("state.pickle"), "wb") as f:
+                f.write(content)
+            self.assertEqual(self.make("state.json", 1)._read_state(), {})
+
+        # unpickling a missing global raises ModuleNotFoundError.
+        with open(self.path("state.pickle"), "wb") as f:
+            f.write(b"cnonexistent_module\nthing\n.")
+        self.assertEqual(self.make("state.json", 1)._read_state(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()